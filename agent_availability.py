@@ -4,17 +4,23 @@ Agent Availability Script - Interactive Terminal Application
 Calculates agent availability per Domain and Operating System using CSV inputs and SQLite database.
 """
 
+import atexit
 import csv
+import re
 import sqlite3
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Tuple, Set, Optional
+from typing import List, Dict, Tuple, Set, Optional, Iterable
 import os
 
-import openpyxl
-from openpyxl.styles import PatternFill, Font, Alignment
-from openpyxl.workbook import Workbook
+import xlsxwriter
 
 from docx import Document
 from docx.shared import Pt, RGBColor, Inches
@@ -33,10 +39,75 @@ BASELINE_COLUMNS = ["Domain", "Agent Name"]
 # Column names for availability CSVs
 AVAILABILITY_COLUMNS = ["Domain", "Agent Name", "Last Available Date"]
 
+# Frozen forms of the expected headers, built once for validation
+_BASELINE_HEADER = tuple(BASELINE_COLUMNS)
+_AVAILABILITY_HEADER_LOWER = tuple(h.lower() for h in AVAILABILITY_COLUMNS)
+
+# Rows per multi-row INSERT (3 parameters each, under SQLite's 999 default)
+INSERT_CHUNK_ROWS = 300
+
+# Read buffer for streaming availability CSVs
+CSV_BUFFER_SIZE = 1 << 20
+
+# Supported date formats for the Last Available Date column
+DATE_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",           # Standard format: 2026-01-31 12:38:00
+    "%b %d, %Y @ %H:%M:%S.%f",     # User's format: Jan 31, 2026 @ 12:38:00.504
+    "%b %d, %Y @ %H:%M:%S",        # Without milliseconds: Jan 31, 2026 @ 12:38:00
+    "%B %d, %Y @ %H:%M:%S.%f",     # Full month name: January 31, 2026 @ 12:38:00.504
+    "%B %d, %Y @ %H:%M:%S",        # Full month name without milliseconds
+    "%d-%m-%Y %H:%M:%S",           # DD-MM-YYYY HH:MM:SS
+    "%m/%d/%Y %H:%M:%S",           # MM/DD/YYYY HH:MM:SS
+    "%Y/%m/%d %H:%M:%S",           # YYYY/MM/DD HH:MM:SS
+]
+
+# Precompiled matcher for DATE_FORMATS; each layout is a named branch
+_TIME_RE = r"(?P<{0}_H>\d{{1,2}}):(?P<{0}_M>\d{{2}}):(?P<{0}_S>\d{{2}})"
+DATE_RE = re.compile(
+    r"^(?:"
+    r"(?P<iso>(?P<iso_y>\d{4})-(?P<iso_m>\d{2})-(?P<iso_d>\d{2}) " + _TIME_RE.format("iso") + r")"
+    r"|(?P<at>(?P<at_m>[A-Za-z]+) (?P<at_d>\d{1,2}), (?P<at_y>\d{4}) @ " + _TIME_RE.format("at")
+    + r"(?:\.(?P<at_f>\d{1,6}))?)"
+    r"|(?P<dmy>(?P<dmy_d>\d{1,2})-(?P<dmy_m>\d{1,2})-(?P<dmy_y>\d{4}) " + _TIME_RE.format("dmy") + r")"
+    r"|(?P<mdy>(?P<mdy_m>\d{1,2})/(?P<mdy_d>\d{1,2})/(?P<mdy_y>\d{4}) " + _TIME_RE.format("mdy") + r")"
+    r"|(?P<ymd>(?P<ymd_y>\d{4})/(?P<ymd_m>\d{1,2})/(?P<ymd_d>\d{1,2}) " + _TIME_RE.format("ymd") + r")"
+    r")$",
+    re.ASCII,
+)
+
+# Month names for the '@' date format
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+    "january": 1, "february": 2, "march": 3, "april": 4, "june": 6,
+    "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
+}
+
+# Pragmas applied to the shared database connection
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Set to 1 to skip fsyncs entirely; only safe for one-shot rebuilds of a disposable database
+SYNC_OFF_ENV = "AGENT_DB_SYNC_OFF"
+
+# Shared database connection and the path it was opened on
+_CONN: Optional[sqlite3.Connection] = None
+_CONN_PATH: Optional[str] = None
+
 # Red fill for unavailable hosts in Excel
-RED_FILL = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-HEADER_FONT = Font(bold=True, color="FFFFFF")
+RED_FORMAT = {"bg_color": "#FF0000"}
+HEADER_FORMAT = {
+    "bold": True,
+    "font_color": "#FFFFFF",
+    "bg_color": "#4472C4",
+    "align": "center",
+    "valign": "vcenter",
+}
 
 # Persistent data directory
 DATA_DIR = Path("data")
@@ -77,6 +148,48 @@ def get_db_path() -> Path:
     return DB_FILE
 
 
+def _get_conn() -> sqlite3.Connection:
+    """
+    Get the shared database connection, opening it on first use.
+
+    The connection is reopened if the database path changes.
+
+    Returns:
+        Open SQLite connection in autocommit mode.
+    """
+    global _CONN, _CONN_PATH
+
+    db_path = str(get_db_path())
+    if _CONN is None or _CONN_PATH != db_path:
+        reset_connection()
+        _CONN = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        _CONN.executescript(SQLITE_PRAGMAS)
+        if os.environ.get(SYNC_OFF_ENV) == "1":
+            _CONN.execute("PRAGMA synchronous=OFF")
+        _CONN_PATH = db_path
+        _query_baseline_agents.cache_clear()
+
+    return _CONN
+
+
+def reset_connection():
+    """
+    Close the shared database connection if it is open.
+
+    The next database operation opens a fresh connection, e.g. after
+    DB_FILE has been pointed somewhere else.
+    """
+    global _CONN, _CONN_PATH
+
+    if _CONN is not None:
+        _CONN.close()
+    _CONN = None
+    _CONN_PATH = None
+
+
+atexit.register(reset_connection)
+
+
 def show_database_info():
     """Display information about the persistent database."""
     db_path = get_db_path()
@@ -90,8 +203,7 @@ def show_database_info():
         mtime = datetime.fromtimestamp(db_path.stat().st_mtime)
 
         # Get agent counts
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
+        cursor = _get_conn().cursor()
 
         cursor.execute(f'SELECT COUNT(*) FROM {WINDOWS_TABLE}')
         windows_count = cursor.fetchone()[0]
@@ -99,8 +211,6 @@ def show_database_info():
         cursor.execute(f'SELECT COUNT(*) FROM {LINUX_TABLE}')
         linux_count = cursor.fetchone()[0]
 
-        conn.close()
-
         print("\n" + "=" * 50)
         print("PERSISTENT DATABASE INFO")
         print("=" * 50)
@@ -149,33 +259,46 @@ def validate_baseline_csv(csv_path: Path) -> List[Tuple[str, str]]:
         raise CSVValidationError(f"CSV file is empty: {csv_path}")
 
     records = []
+    append = records.append
+    intern = sys.intern
+    seen = set()
+    add_seen = seen.add
 
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
 
         # Validate headers
-        headers = reader.fieldnames
+        headers = next(reader, None)
         if headers is None:
             raise CSVValidationError(f"CSV file has no headers: {csv_path}")
 
         # Strip BOM and whitespace from headers
         normalized_headers = [h.strip().strip('\ufeff') for h in headers]
-        if normalized_headers != BASELINE_COLUMNS:
+        if tuple(normalized_headers) != _BASELINE_HEADER:
             raise CSVValidationError(
                 f"Invalid headers in {csv_path}. Expected: {BASELINE_COLUMNS}, Got: {normalized_headers}"
             )
 
         # Parse rows
         for row_num, row in enumerate(reader, start=2):
-            domain = row["Domain"].strip()
-            agent_name = row["Agent Name"].strip()
+            if not row:
+                continue
+
+            domain = row[0].strip()
+            agent_name = row[1].strip() if len(row) > 1 else ""
 
             if not domain or not agent_name:
                 raise CSVValidationError(
                     f"Empty domain or agent name in {csv_path} at row {row_num}"
                 )
 
-            records.append((domain, agent_name))
+            record = (intern(domain), intern(agent_name))
+            if record in seen:
+                raise CSVValidationError(
+                    f"Duplicate agent {agent_name} in domain {domain} in {csv_path} at row {row_num}"
+                )
+            add_seen(record)
+            append(record)
 
     if not records:
         raise CSVValidationError(f"No data records found in CSV: {csv_path}")
@@ -206,48 +329,30 @@ def validate_availability_csv(csv_path: Path) -> List[Tuple[str, str, str]]:
         return []
 
     records = []
+    append = records.append
+    intern = sys.intern
 
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        # Read all lines
-        lines = f.readlines()
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=CSV_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
 
-        if not lines:
+        header = next(reader, None)
+        if not header:
             raise CSVValidationError(f"CSV file is empty: {csv_path}")
 
         # Parse header - handle quoted column names
-        header_line = lines[0].strip()
-        headers = [h.strip().strip('\ufeff').strip('"').strip("'") for h in header_line.split(',')]
+        headers = [h.strip().strip('\ufeff').strip('"').strip("'") for h in header]
 
         # Validate headers - case-insensitive comparison
-        headers_normalized = [h.strip().strip('\ufeff').strip('"').strip("'").lower() for h in headers]
-        expected_normalized = [h.lower() for h in AVAILABILITY_COLUMNS]
-        if headers_normalized != expected_normalized:
+        if tuple(h.lower() for h in headers) != _AVAILABILITY_HEADER_LOWER:
             raise CSVValidationError(
                 f"Invalid headers in {csv_path}. Expected: {AVAILABILITY_COLUMNS}, Got: {headers}"
             )
 
         # Parse data rows
-        for row_num, line in enumerate(lines[1:], start=2):
-            line = line.strip()
-            if not line:
+        for row_num, parts in enumerate(reader, start=2):
+            if not parts or not any(p.strip() for p in parts):
                 continue
 
-            # Handle quoted/unquoted CSV values
-            # Split by comma but respect quotes
-            parts = []
-            current = ""
-            in_quotes = False
-
-            for char in line:
-                if char == '"':
-                    in_quotes = not in_quotes
-                elif char == ',' and not in_quotes:
-                    parts.append(current)
-                    current = ""
-                else:
-                    current += char
-            parts.append(current)
-
             # Ensure we have at least 3 parts
             if len(parts) < 3:
                 raise CSVValidationError(
@@ -259,16 +364,19 @@ def validate_availability_csv(csv_path: Path) -> List[Tuple[str, str, str]]:
             domain = parts[0].strip().strip('"').strip("'")
             agent_name = parts[1].strip().strip('"').strip("'")
 
-            # The date column is everything from index 2 onwards, joined with commas
-            # (because dates like "Jan 31, 2026 @ 12:38:00.504" get split on the comma)
-            available_date = ", ".join(p.strip().strip('"').strip("'") for p in parts[2:])
+            # Quoted dates like "Jan 31, 2026 @ 12:38:00.504" arrive as a single field;
+            # unquoted ones get split on the comma, so rejoin anything past index 2
+            if len(parts) > 3:
+                available_date = ", ".join(p.strip().strip('"').strip("'") for p in parts[2:])
+            else:
+                available_date = parts[2].strip().strip('"').strip("'")
 
             if not agent_name or not domain:
                 raise CSVValidationError(
                     f"Empty domain or agent name in {csv_path} at row {row_num}"
                 )
 
-            records.append((domain, agent_name, available_date))
+            append((intern(domain), intern(agent_name), available_date))
 
     if not records:
         return []
@@ -284,8 +392,7 @@ def create_database():
         - windows_agents table
         - linux_agents table
     """
-    conn = sqlite3.connect(str(get_db_path()))
-    cursor = conn.cursor()
+    cursor = _get_conn().cursor()
 
     # Create Windows agents table
     cursor.execute(f'''
@@ -307,8 +414,78 @@ def create_database():
         )
     ''')
 
-    conn.commit()
-    conn.close()
+
+def _insert_rows(cursor: sqlite3.Cursor, table_name: str, rows: Iterable[Tuple[str, str, str]]):
+    """
+    Insert baseline rows using multi-row VALUES statements.
+
+    Rows are sent INSERT_CHUNK_ROWS at a time so each statement stays under
+    SQLite's default limit of 999 bound parameters.
+
+    Args:
+        cursor: Cursor inside an open transaction.
+        table_name: Name of the table to insert into.
+        rows: Iterable of (domain, agent_name, operating_system) tuples.
+    """
+    sql = f'INSERT INTO {table_name} (domain, agent_name, operating_system) VALUES '
+    full_chunk_sql = sql + ', '.join(['(?, ?, ?)'] * INSERT_CHUNK_ROWS)
+
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, INSERT_CHUNK_ROWS))
+        if not chunk:
+            break
+
+        params = [value for row in chunk for value in row]
+        if len(chunk) == INSERT_CHUNK_ROWS:
+            cursor.execute(full_chunk_sql, params)
+        else:
+            cursor.execute(sql + ', '.join(['(?, ?, ?)'] * len(chunk)), params)
+
+
+def _bulk_load(table_name: str, records: List[Tuple[str, str]], os_label: str):
+    """
+    Replace the contents of a baseline table in a single transaction.
+
+    Only rows that were removed or added since the previous load are touched,
+    so reloading a mostly unchanged baseline does not rewrite the table.
+
+    Args:
+        table_name: Name of the table to load.
+        records: List of (domain, agent_name) tuples.
+        os_label: Operating system label stored with each record.
+    """
+    cursor = _get_conn().cursor()
+
+    # Take the write lock up front so the read-then-write below cannot hit a lock upgrade
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        cursor.execute(f'SELECT domain, agent_name FROM {table_name}')
+        existing = set(cursor)
+        new = set(records)
+        to_add = new - existing
+
+        # Remove agents no longer in the baseline
+        cursor.executemany(
+            f'DELETE FROM {table_name} WHERE domain = ? AND agent_name = ?',
+            existing - new
+        )
+
+        # Insert new records in (domain, agent_name) order so index pages fill sequentially
+        _insert_rows(cursor, table_name, ((domain, agent_name, os_label) for domain, agent_name in sorted(to_add)))
+
+        cursor.execute("COMMIT")
+    except Exception:
+        # Leave the shared connection usable for later operations
+        cursor.execute("ROLLBACK")
+        raise
+
+    # The shared connection stays open, so fold the WAL back into the main file
+    # here; otherwise the database file's size and mtime go stale
+    cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    # Our own commits do not bump data_version, so drop cached results explicitly
+    _query_baseline_agents.cache_clear()
 
 
 def load_baseline_windows(csv_path: Path):
@@ -324,21 +501,7 @@ def load_baseline_windows(csv_path: Path):
     """
     records = validate_baseline_csv(csv_path)
 
-    conn = sqlite3.connect(str(get_db_path()))
-    cursor = conn.cursor()
-
-    # Clear existing Windows data
-    cursor.execute(f'DELETE FROM {WINDOWS_TABLE}')
-
-    # Insert new records
-    for domain, agent_name in records:
-        cursor.execute(
-            f'INSERT INTO {WINDOWS_TABLE} (domain, agent_name, operating_system) VALUES (?, ?, ?)',
-            (domain, agent_name, 'Windows')
-        )
-
-    conn.commit()
-    conn.close()
+    _bulk_load(WINDOWS_TABLE, records, 'Windows')
 
     print(f"\nSuccessfully loaded {len(records)} Windows agents from {csv_path}")
 
@@ -356,23 +519,86 @@ def load_baseline_linux(csv_path: Path):
     """
     records = validate_baseline_csv(csv_path)
 
-    conn = sqlite3.connect(str(get_db_path()))
-    cursor = conn.cursor()
+    _bulk_load(LINUX_TABLE, records, 'Linux')
 
-    # Clear existing Linux data
-    cursor.execute(f'DELETE FROM {LINUX_TABLE}')
+    print(f"\nSuccessfully loaded {len(records)} Linux agents from {csv_path}")
 
-    # Insert new records
-    for domain, agent_name in records:
-        cursor.execute(
-            f'INSERT INTO {LINUX_TABLE} (domain, agent_name, operating_system) VALUES (?, ?, ?)',
-            (domain, agent_name, 'Linux')
+
+def _match_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a date string with the precompiled DATE_RE matcher.
+
+    Args:
+        date_str: Stripped date string.
+
+    Returns:
+        datetime object, or None if no supported layout matches.
+    """
+    match = DATE_RE.match(date_str)
+    if match is None:
+        return None
+
+    # lastgroup is the name of the layout branch that matched
+    layout = match.lastgroup
+    group = match.group
+
+    if layout == "at":
+        month = _MONTHS.get(group("at_m").lower())
+        if month is None:
+            return None
+        fraction = group("at_f")
+        microsecond = int(fraction.ljust(6, "0")) if fraction else 0
+    else:
+        month = int(group(f"{layout}_m"))
+        microsecond = 0
+
+    try:
+        return datetime(
+            int(group(f"{layout}_y")),
+            month,
+            int(group(f"{layout}_d")),
+            int(group(f"{layout}_H")),
+            int(group(f"{layout}_M")),
+            int(group(f"{layout}_S")),
+            microsecond,
         )
+    except ValueError:
+        return None
 
-    conn.commit()
-    conn.close()
 
-    print(f"\nSuccessfully loaded {len(records)} Linux agents from {csv_path}")
+def _is_iso_datetime(date_str: str) -> bool:
+    """Check whether a date string has the fixed 'YYYY-MM-DD HH:MM:SS' shape."""
+    return (
+        len(date_str) == 19
+        and date_str[4] == date_str[7] == "-"
+        and date_str[10] == " "
+        and date_str[13] == date_str[16] == ":"
+    )
+
+
+def _parse_date_column(date_strs: List[str]) -> List[datetime]:
+    """
+    Parse a column of date strings in one pass.
+
+    When every value has the 'YYYY-MM-DD HH:MM:SS' shape the whole column is
+    handed to the C-implemented datetime.fromisoformat via map().
+
+    Args:
+        date_strs: Stripped date strings.
+
+    Returns:
+        List of datetime objects in the same order.
+
+    Raises:
+        CSVValidationError: If any date format is invalid.
+    """
+    if all(map(_is_iso_datetime, date_strs)):
+        try:
+            return list(map(datetime.fromisoformat, date_strs))
+        except ValueError:
+            pass
+
+    return list(map(parse_available_date, date_strs))
 
 
 def parse_available_date(date_str: str) -> datetime:
@@ -392,22 +618,23 @@ def parse_available_date(date_str: str) -> datetime:
     Raises:
         CSVValidationError: If date format is invalid.
     """
-    # List of supported date formats
-    date_formats = [
-        "%Y-%m-%d %H:%M:%S",           # Standard format: 2026-01-31 12:38:00
-        "%b %d, %Y @ %H:%M:%S.%f",     # User's format: Jan 31, 2026 @ 12:38:00.504
-        "%b %d, %Y @ %H:%M:%S",        # Without milliseconds: Jan 31, 2026 @ 12:38:00
-        "%B %d, %Y @ %H:%M:%S.%f",     # Full month name: January 31, 2026 @ 12:38:00.504
-        "%B %d, %Y @ %H:%M:%S",        # Full month name without milliseconds
-        "%d-%m-%Y %H:%M:%S",           # DD-MM-YYYY HH:MM:SS
-        "%m/%d/%Y %H:%M:%S",           # MM/DD/YYYY HH:MM:SS
-        "%Y/%m/%d %H:%M:%S",           # YYYY/MM/DD HH:MM:SS
-    ]
-
     # Clean the date string (remove extra whitespace)
     date_str = date_str.strip()
 
-    for fmt in date_formats:
+    # Fast path: 'YYYY-MM-DD HH:MM:SS' via the C ISO parser
+    if _is_iso_datetime(date_str):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+
+    # Fast path: single regex scan over all supported layouts
+    parsed = _match_date(date_str)
+    if parsed is not None:
+        return parsed
+
+    # Slow path: strptime tolerates variants the regex does not (e.g. single-digit fields)
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -420,47 +647,75 @@ def parse_available_date(date_str: str) -> datetime:
     )
 
 
-def is_within_last_24_hours(available_date: datetime) -> bool:
+def availability_cutoff() -> datetime:
+    """
+    Get the oldest Last Available Date that still counts as available.
+
+    Returns:
+        datetime 24 hours before now.
+    """
+    return datetime.now() - timedelta(hours=24)
+
+
+def is_within_last_24_hours(available_date: datetime, cutoff: Optional[datetime] = None) -> bool:
     """
     Check if a datetime is within the last 24 hours from now.
 
     Args:
         available_date: The datetime to check.
+        cutoff: Precomputed availability_cutoff() to reuse across many checks.
 
     Returns:
         True if within last 24 hours, False otherwise.
     """
-    now = datetime.now()
-    twenty_four_hours_ago = now - timedelta(hours=24)
-    return available_date >= twenty_four_hours_ago
+    if cutoff is None:
+        cutoff = availability_cutoff()
+    return available_date >= cutoff
 
 
-def get_baseline_agents(table_name: str) -> Dict[str, Set[str]]:
+@lru_cache(maxsize=8)
+def _query_baseline_agents(table_name: str, db_path: str, data_version: int) -> Dict[str, Set[str]]:
     """
-    Get all baseline agents from database grouped by domain.
+    Query baseline agents, memoized per (table, database, data version).
 
     Args:
         table_name: Name of the table to query.
+        db_path: Database path the shared connection is open on.
+        data_version: SQLite data_version at the time of the call.
 
     Returns:
         Dictionary mapping domain to set of agent names.
     """
-    conn = sqlite3.connect(str(get_db_path()))
-    cursor = conn.cursor()
+    cursor = _get_conn().cursor()
 
-    cursor.execute(f'SELECT DISTINCT domain, agent_name FROM {table_name}')
-    rows = cursor.fetchall()
+    # UNIQUE(domain, agent_name) makes DISTINCT redundant, and its index serves ORDER BY
+    cursor.execute(f'SELECT domain, agent_name FROM {table_name} ORDER BY domain')
 
-    conn.close()
+    agent_of = itemgetter(1)
+    return {
+        domain: set(map(agent_of, rows))
+        for domain, rows in groupby(cursor, key=itemgetter(0))
+    }
 
-    agents_by_domain: Dict[str, Set[str]] = {}
 
-    for domain, agent_name in rows:
-        if domain not in agents_by_domain:
-            agents_by_domain[domain] = set()
-        agents_by_domain[domain].add(agent_name)
+def get_baseline_agents(table_name: str) -> Dict[str, Set[str]]:
+    """
+    Get all baseline agents from database grouped by domain.
 
-    return agents_by_domain
+    Args:
+        table_name: Name of the table to query.
+
+    Returns:
+        Dictionary mapping domain to set of agent names. The result is cached
+        and shared between callers, so neither the dict nor its sets may be
+        mutated.
+    """
+    conn = _get_conn()
+
+    # data_version changes whenever another connection commits to the database
+    data_version = conn.execute('PRAGMA data_version').fetchone()[0]
+
+    return _query_baseline_agents(table_name, _CONN_PATH, data_version)
 
 
 def get_availability_records(csv_path: Path) -> Dict[Tuple[str, str], datetime]:
@@ -477,13 +732,27 @@ def get_availability_records(csv_path: Path) -> Dict[Tuple[str, str], datetime]:
 
     availability_map: Dict[Tuple[str, str], datetime] = {}
 
-    # records are now (domain, agent_name, available_date_str)
-    for domain, agent_name, available_date_str in records:
-        available_date = parse_available_date(available_date_str)
-        key = (agent_name, domain)
-        # Keep the most recent date if duplicates exist
-        if key not in availability_map or available_date > availability_map[key]:
-            availability_map[key] = available_date
+    # records are (domain, agent_name, available_date_str); group by key to split
+    # singleton keys (parsed together as one column) from duplicated ones
+    domain_agent = itemgetter(0, 1)
+    records.sort(key=domain_agent)
+
+    keys = []
+    latest_strs = []
+
+    for (domain, agent_name), group in groupby(records, key=domain_agent):
+        date_strs = [record[2] for record in group]
+
+        if len(date_strs) == 1:
+            keys.append((agent_name, domain))
+            latest_strs.append(date_strs[0])
+        else:
+            # Keep the most recent date if duplicates exist; every one is parsed so
+            # an invalid duplicate still raises
+            availability_map[(agent_name, domain)] = max(_parse_date_column(date_strs))
+
+    # Parse the remaining one-per-key date strings as a single column
+    availability_map.update(zip(keys, _parse_date_column(latest_strs)))
 
     return availability_map
 
@@ -511,37 +780,48 @@ def calculate_availability(
                 "total": int,
                 "available": set of agent names,
                 "not_available": set of agent names,
+                "available_sorted": sorted list of available agent names,
+                "not_available_sorted": sorted list of not available agent names,
                 "last_available_dates": dict mapping agent_name to last available date
             }
         }
     """
     results = {}
 
+    # Compute the 24-hour cutoff once for the whole run
+    cutoff = availability_cutoff()
+
+    # Index reported agents by domain so baseline membership is a C-level set op
+    reported_by_domain: Dict[str, Set[str]] = defaultdict(set)
+    for agent_name, domain in availability_map:
+        reported_by_domain[domain].add(agent_name)
+
     for domain, agents in baseline_agents.items():
+        # Check rule 1: exists in baseline (always true here)
+        # Check rule 2: exists in availability CSV
+        reported = agents & reported_by_domain.get(domain, set())
+        available = set()
+        not_available = agents - reported
+        last_available_dates = {}
         domain_results = {
             "total": len(agents),
-            "available": set(),
-            "not_available": set(),
-            "last_available_dates": {}
+            "available": available,
+            "not_available": not_available,
+            "last_available_dates": last_available_dates
         }
 
-        for agent_name in agents:
-            key = (agent_name, domain)
-
-            # Check rule 1: exists in baseline (always true here)
-            # Check rule 2: exists in availability CSV
-            if key not in availability_map:
-                domain_results["not_available"].add(agent_name)
-                continue
-
+        for agent_name in reported:
             # Check rule 3: within last 24 hours
-            available_date = availability_map[key]
-            if is_within_last_24_hours(available_date):
-                domain_results["available"].add(agent_name)
-                domain_results["last_available_dates"][agent_name] = available_date
+            available_date = availability_map[(agent_name, domain)]
+            last_available_dates[agent_name] = available_date
+            if available_date >= cutoff:
+                available.add(agent_name)
             else:
-                domain_results["not_available"].add(agent_name)
-                domain_results["last_available_dates"][agent_name] = available_date
+                not_available.add(agent_name)
+
+        # Sort once here so every report format can reuse the ordering
+        domain_results["available_sorted"] = sorted(available)
+        domain_results["not_available_sorted"] = sorted(not_available)
 
         results[domain] = domain_results
 
@@ -576,7 +856,7 @@ def print_console_report(windows_results: Dict, linux_results: Dict):
 
         if not_available:
             print("Hosts Not Available:")
-            for host in sorted(not_available):
+            for host in result["not_available_sorted"]:
                 print(f"\t*\t{host}")
         else:
             print("Hosts Not Available: None")
@@ -597,7 +877,7 @@ def print_console_report(windows_results: Dict, linux_results: Dict):
 
         if not_available:
             print("Hosts Not Available:")
-            for host in sorted(not_available):
+            for host in result["not_available_sorted"]:
                 print(f"\t*\t{host}")
         else:
             print("Hosts Not Available: None")
@@ -609,10 +889,8 @@ def print_console_report(windows_results: Dict, linux_results: Dict):
     print("=" * 50)
 
 
-def set_cell_border(cell):
-    """Set borders for a cell in docx table."""
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
+def _build_cell_borders():
+    """Build the tcBorders element shared by all docx table cells."""
     tcBorders = OxmlElement('w:tcBorders')
 
     for border_name in ['top', 'left', 'bottom', 'right']:
@@ -622,7 +900,88 @@ def set_cell_border(cell):
         border.set(qn('w:color'), '000000')
         tcBorders.append(border)
 
-    tcPr.append(tcBorders)
+    return tcBorders
+
+
+# Border template copied into each docx table cell
+CELL_BORDERS = _build_cell_borders()
+
+
+def set_cell_border(cell):
+    """Set borders for a cell in docx table."""
+    tc = cell._tc
+    tcPr = tc.get_or_add_tcPr()
+    tcPr.append(deepcopy(CELL_BORDERS))
+
+
+def _track_widths(col_max: List[int], row: List):
+    """Update the running max text length per column with a new row."""
+    for i, value in enumerate(row):
+        length = len(str(value))
+        if length > col_max[i]:
+            col_max[i] = length
+
+
+def _set_column_widths(ws, col_max: List[int]):
+    """Set worksheet column widths from tracked max lengths."""
+    for i, max_length in enumerate(col_max):
+        ws.set_column(i, i, min(max_length + 2, 50))
+
+
+def _emit_xlsx_sheet(wb, os_name: str, results: Dict, headers: List[str], header_format, red_format):
+    """
+    Write one OS sheet of the Excel report.
+
+    Args:
+        wb: xlsxwriter workbook to add the sheet to.
+        os_name: Operating system name used for the sheet title and OS column.
+        results: Availability results for the OS, keyed by domain.
+        headers: Column headers.
+        header_format: Format applied to the header row.
+        red_format: Format applied to NOT AVAILABLE rows.
+    """
+    ws = wb.add_worksheet(os_name)
+    col_max = [len(h) for h in headers]
+    write_row = ws.write_row
+
+    write_row(0, 0, headers, header_format)
+    row_idx = 1
+
+    for domain, result in results.items():
+        last_available_dates = result["last_available_dates"]
+
+        # Available agents
+        for agent in result["available_sorted"]:
+            last_date = last_available_dates[agent]
+            row = (
+                os_name,
+                domain,
+                agent,
+                "Available",
+                last_date.strftime("%Y-%m-%d %H:%M:%S")
+            )
+            write_row(row_idx, 0, row)
+            _track_widths(col_max, row)
+            row_idx += 1
+
+        # Not available agents
+        for agent in result["not_available_sorted"]:
+            last_date = last_available_dates.get(agent)
+            date_str = last_date.strftime("%Y-%m-%d %H:%M:%S") if last_date else "N/A"
+            row = (
+                os_name,
+                domain,
+                agent,
+                "Not Available",
+                date_str
+            )
+            # Highlight row in red
+            write_row(row_idx, 0, row, red_format)
+            _track_widths(col_max, row)
+            row_idx += 1
+
+    # Auto-adjust column widths
+    _set_column_widths(ws, col_max)
 
 
 def generate_xlsx_report(
@@ -642,123 +1001,90 @@ def generate_xlsx_report(
 
     Rows with NOT AVAILABLE hosts are highlighted RED.
     """
-    wb = Workbook()
-
-    # Remove default sheet
-    if "Sheet" in wb.sheetnames:
-        del wb["Sheet"]
+    # constant_memory streams each row to disk once the next row starts
+    wb = xlsxwriter.Workbook(str(output_path), {"constant_memory": True})
+    header_format = wb.add_format(HEADER_FORMAT)
+    red_format = wb.add_format(RED_FORMAT)
 
     # Define column headers
     headers = ["OS", "Domain", "Agent Name", "Status", "Last Available Date"]
 
-    # Create Windows sheet
-    ws_windows = wb.create_sheet("Windows")
-    ws_windows.append(headers)
+    for os_name, results in (("Windows", windows_results), ("Linux", linux_results)):
+        _emit_xlsx_sheet(wb, os_name, results, headers, header_format, red_format)
 
-    # Format header row
-    for cell in ws_windows[1]:
-        cell.fill = HEADER_FILL
-        cell.font = HEADER_FONT
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+    wb.close()
+    print(f"\nExcel report generated: {output_path}")
 
-    for domain, result in windows_results.items():
-        # Available agents
-        for agent in sorted(result["available"]):
-            last_date = result["last_available_dates"][agent]
-            row = [
-                "Windows",
-                domain,
-                agent,
-                "Available",
-                last_date.strftime("%Y-%m-%d %H:%M:%S")
-            ]
-            ws_windows.append(row)
 
-        # Not available agents
-        for agent in sorted(result["not_available"]):
-            last_date = result["last_available_dates"].get(agent)
-            date_str = last_date.strftime("%Y-%m-%d %H:%M:%S") if last_date else "N/A"
-            row = [
-                "Windows",
-                domain,
-                agent,
-                "Not Available",
-                date_str
-            ]
-            row_idx = ws_windows.max_row
-            ws_windows.append(row)
-            # Highlight row in red
-            for cell in ws_windows[row_idx]:
-                cell.fill = RED_FILL
+def _emit_docx_section(doc, os_name: str, results: Dict):
+    """
+    Write the per-domain sections for one OS of the Word report.
 
-    # Auto-adjust column widths
-    for column in ws_windows.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws_windows.column_dimensions[column_letter].width = adjusted_width
-
-    # Create Linux sheet
-    ws_linux = wb.create_sheet("Linux")
-    ws_linux.append(headers)
-
-    # Format header row
-    for cell in ws_linux[1]:
-        cell.fill = HEADER_FILL
-        cell.font = HEADER_FONT
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-
-    for domain, result in linux_results.items():
-        # Available agents
-        for agent in sorted(result["available"]):
-            last_date = result["last_available_dates"][agent]
-            row = [
-                "Linux",
-                domain,
-                agent,
-                "Available",
-                last_date.strftime("%Y-%m-%d %H:%M:%S")
-            ]
-            ws_linux.append(row)
+    Args:
+        doc: Document to append to.
+        os_name: Operating system name used in the headings.
+        results: Availability results for the OS, keyed by domain.
+    """
+    add_heading = doc.add_heading
+    add_paragraph = doc.add_paragraph
 
-        # Not available agents
-        for agent in sorted(result["not_available"]):
-            last_date = result["last_available_dates"].get(agent)
-            date_str = last_date.strftime("%Y-%m-%d %H:%M:%S") if last_date else "N/A"
-            row = [
-                "Linux",
-                domain,
-                agent,
-                "Not Available",
-                date_str
-            ]
-            row_idx = ws_linux.max_row
-            ws_linux.append(row)
-            # Highlight row in red
-            for cell in ws_linux[row_idx]:
-                cell.fill = RED_FILL
+    for domain in sorted(results.keys()):
+        result = results[domain]
+        total = result["total"]
+        available_count = len(result["available"])
+        not_available = result["not_available"]
+        percentage = (available_count / total * 100) if total > 0 else 0
 
-    # Auto-adjust column widths
-    for column in ws_linux.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws_linux.column_dimensions[column_letter].width = adjusted_width
-
-    wb.save(output_path)
-    print(f"\nExcel report generated: {output_path}")
+        # Heading: OS + Domain
+        heading_text = f"{os_name} - {domain}"
+        add_heading(heading_text, level=2)
+
+        # Table of unavailable hosts
+        add_paragraph("Unavailable Hosts:", style='Heading 3')
+
+        if not_available:
+            # Create table with headers
+            table = doc.add_table(rows=1, cols=2)
+            table.style = 'Light Grid Accent 1'
+
+            # Set headers
+            hdr_cells = table.rows[0].cells
+            hdr_cells[0].text = "Agent Name"
+            hdr_cells[1].text = "Last Available Date"
+
+            # Format header cells
+            for cell in hdr_cells:
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        run.bold = True
+                set_cell_border(cell)
+
+            # Add unavailable hosts to table
+            add_row = table.add_row
+            last_available_dates = result["last_available_dates"]
+            for agent in result["not_available_sorted"]:
+                last_date = last_available_dates.get(agent)
+                date_str = last_date.strftime("%Y-%m-%d %H:%M:%S") if last_date else "N/A"
+
+                row_cells = add_row().cells
+                row_cells[0].text = agent
+                row_cells[1].text = date_str
+
+                for cell in row_cells:
+                    set_cell_border(cell)
+        else:
+            add_paragraph("No unavailable hosts.")
+
+        # Availability percentage
+        p = add_paragraph()
+        p.add_run("Availability: ").bold = True
+
+        percentage_text = f"{percentage:.1f}%"
+        run = p.add_run(percentage_text)
+        run.font.size = Pt(14)
+        run.font.color.rgb = RGBColor(0x00, 0xFF, 0x00) if percentage >= 75 else RGBColor(0xFF, 0x00, 0x00)
+
+        add_paragraph()  # Blank line between domains
 
 
 def generate_docx_report(
@@ -792,133 +1118,20 @@ def generate_docx_report(
 
     doc.add_paragraph()  # Blank line
 
-    # Process Windows domains
-    if windows_results:
-        for domain in sorted(windows_results.keys()):
-            result = windows_results[domain]
-            total = result["total"]
-            available_count = len(result["available"])
-            not_available = result["not_available"]
-            percentage = (available_count / total * 100) if total > 0 else 0
-
-            # Heading: OS + Domain
-            heading_text = f"Windows - {domain}"
-            doc.add_heading(heading_text, level=2)
-
-            # Table of unavailable hosts
-            doc.add_paragraph("Unavailable Hosts:", style='Heading 3')
-
-            if not_available:
-                # Create table with headers
-                table = doc.add_table(rows=1, cols=2)
-                table.style = 'Light Grid Accent 1'
-
-                # Set headers
-                hdr_cells = table.rows[0].cells
-                hdr_cells[0].text = "Agent Name"
-                hdr_cells[1].text = "Last Available Date"
-
-                # Format header cells
-                for cell in hdr_cells:
-                    for paragraph in cell.paragraphs:
-                        for run in paragraph.runs:
-                            run.bold = True
-                    set_cell_border(cell)
-
-                # Add unavailable hosts to table
-                for agent in sorted(not_available):
-                    last_date = result["last_available_dates"].get(agent)
-                    date_str = last_date.strftime("%Y-%m-%d %H:%M:%S") if last_date else "N/A"
-
-                    row_cells = table.add_row().cells
-                    row_cells[0].text = agent
-                    row_cells[1].text = date_str
-
-                    for cell in row_cells:
-                        set_cell_border(cell)
-            else:
-                doc.add_paragraph("No unavailable hosts.")
-
-            # Availability percentage
-            p = doc.add_paragraph()
-            p.add_run("Availability: ").bold = True
-
-            percentage_text = f"{percentage:.1f}%"
-            run = p.add_run(percentage_text)
-            run.font.size = Pt(14)
-            run.font.color.rgb = RGBColor(0x00, 0xFF, 0x00) if percentage >= 75 else RGBColor(0xFF, 0x00, 0x00)
-
-            doc.add_paragraph()  # Blank line between domains
-
-    # Process Linux domains
-    if linux_results:
-        for domain in sorted(linux_results.keys()):
-            result = linux_results[domain]
-            total = result["total"]
-            available_count = len(result["available"])
-            not_available = result["not_available"]
-            percentage = (available_count / total * 100) if total > 0 else 0
-
-            # Heading: OS + Domain
-            heading_text = f"Linux - {domain}"
-            doc.add_heading(heading_text, level=2)
-
-            # Table of unavailable hosts
-            doc.add_paragraph("Unavailable Hosts:", style='Heading 3')
-
-            if not_available:
-                # Create table with headers
-                table = doc.add_table(rows=1, cols=2)
-                table.style = 'Light Grid Accent 1'
-
-                # Set headers
-                hdr_cells = table.rows[0].cells
-                hdr_cells[0].text = "Agent Name"
-                hdr_cells[1].text = "Last Available Date"
-
-                # Format header cells
-                for cell in hdr_cells:
-                    for paragraph in cell.paragraphs:
-                        for run in paragraph.runs:
-                            run.bold = True
-                    set_cell_border(cell)
-
-                # Add unavailable hosts to table
-                for agent in sorted(not_available):
-                    last_date = result["last_available_dates"].get(agent)
-                    date_str = last_date.strftime("%Y-%m-%d %H:%M:%S") if last_date else "N/A"
-
-                    row_cells = table.add_row().cells
-                    row_cells[0].text = agent
-                    row_cells[1].text = date_str
-
-                    for cell in row_cells:
-                        set_cell_border(cell)
-            else:
-                doc.add_paragraph("No unavailable hosts.")
-
-            # Availability percentage
-            p = doc.add_paragraph()
-            p.add_run("Availability: ").bold = True
-
-            percentage_text = f"{percentage:.1f}%"
-            run = p.add_run(percentage_text)
-            run.font.size = Pt(14)
-            run.font.color.rgb = RGBColor(0x00, 0xFF, 0x00) if percentage >= 75 else RGBColor(0xFF, 0x00, 0x00)
-
-            doc.add_paragraph()  # Blank line between domains
+    for os_name, results in (("Windows", windows_results), ("Linux", linux_results)):
+        _emit_docx_section(doc, os_name, results)
 
     doc.save(output_path)
     print(f"Word report generated: {output_path}")
 
 
-def check_availability(windows_csv: Path, linux_csv: Path, output_base: str):
+def check_availability(windows_csv: Optional[Path], linux_csv: Optional[Path], output_base: str):
     """
     Main function to check agent availability.
 
     Args:
-        windows_csv: Path to Windows availability CSV.
-        linux_csv: Path to Linux availability CSV.
+        windows_csv: Path to Windows availability CSV, or None if no Windows agents are available.
+        linux_csv: Path to Linux availability CSV, or None if no Linux agents are available.
         output_base: Base name for output reports (without extension).
     """
     # Get baseline agents from database
@@ -930,9 +1143,9 @@ def check_availability(windows_csv: Path, linux_csv: Path, output_base: str):
         print("Please load baseline data first using options 1 or 2.")
         return False
 
-    # Parse availability CSVs
-    windows_availability = get_availability_records(windows_csv)
-    linux_availability = get_availability_records(linux_csv)
+    # Parse availability CSVs (None means no agents reported for that OS)
+    windows_availability = get_availability_records(windows_csv) if windows_csv is not None else {}
+    linux_availability = get_availability_records(linux_csv) if linux_csv is not None else {}
 
     # Calculate availability
     windows_results = calculate_availability(windows_baseline, windows_availability)
@@ -946,8 +1159,12 @@ def check_availability(windows_csv: Path, linux_csv: Path, output_base: str):
     xlsx_path = reports_dir / f"{output_base}.xlsx"
     docx_path = reports_dir / f"{output_base}.docx"
 
-    generate_xlsx_report(windows_results, linux_results, xlsx_path)
-    generate_docx_report(windows_results, linux_results, docx_path)
+    # The two report formats are independent, so write them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        xlsx_future = executor.submit(generate_xlsx_report, windows_results, linux_results, xlsx_path)
+        docx_future = executor.submit(generate_docx_report, windows_results, linux_results, docx_path)
+        xlsx_future.result()
+        docx_future.result()
 
     print(f"\nReports saved to: {reports_dir.absolute()}")
 
@@ -1064,37 +1281,11 @@ def main():
                     output_name = output_name[:-5]
 
                 try:
-                    # Handle None values
-                    if windows_csv is None:
-                        windows_csv = Path("placeholder_empty.csv")
-                        # Create empty file for validation
-                        with open(windows_csv, 'w') as f:
-                            f.write("Domain,Agent Name,Last Available Date\n")
-                    if linux_csv is None:
-                        linux_csv = Path("placeholder_empty.csv")
-                        with open(linux_csv, 'w') as f:
-                            f.write("Domain,Agent Name,Last Available Date\n")
-
                     check_availability(windows_csv, linux_csv, output_name)
-
-                    # Clean up placeholders
-                    if windows_csv.name.startswith("placeholder"):
-                        windows_csv.unlink()
-                    if linux_csv.name.startswith("placeholder"):
-                        linux_csv.unlink()
-
                 except AgentAvailabilityError as e:
                     print(f"Error: {e}")
-                    if windows_csv.name.startswith("placeholder"):
-                        windows_csv.unlink()
-                    if linux_csv.name.startswith("placeholder"):
-                        linux_csv.unlink()
                 except Exception as e:
                     print(f"Unexpected error: {e}")
-                    if windows_csv.name.startswith("placeholder"):
-                        windows_csv.unlink()
-                    if linux_csv.name.startswith("placeholder"):
-                        linux_csv.unlink()
 
             input("\nPress Enter to continue...")
 
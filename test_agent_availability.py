@@ -9,12 +9,15 @@ Each test case includes:
 """
 
 import csv
+import io
+import sqlite3
 import unittest
 import tempfile
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
 import shutil
+from contextlib import closing, redirect_stdout
 
 import agent_availability as aa
 
@@ -22,19 +25,29 @@ import agent_availability as aa
 class TestAgentAvailability(unittest.TestCase):
     """Test cases for agent availability functionality."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_db_path = Path(self.temp_dir) / "test_agents.db"
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory and database shared by all tests."""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.test_db_path = Path(cls.temp_dir) / "test_agents.db"
 
         # Override the DB_FILE constant for testing
+        aa.DB_FILE = str(cls.test_db_path)
+        aa.create_database()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory and database."""
+        aa.reset_connection()
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        """Empty the baseline tables before each test method."""
         aa.DB_FILE = str(self.test_db_path)
 
-    def tearDown(self):
-        """Clean up test fixtures after each test method."""
-        if Path(self.test_db_path).exists():
-            Path(self.test_db_path).unlink()
-        shutil.rmtree(self.temp_dir)
+        # A separate connection bumps data_version, so cached baselines are dropped too
+        with closing(sqlite3.connect(self.test_db_path)) as conn:
+            conn.executescript(f"DELETE FROM {aa.WINDOWS_TABLE}; DELETE FROM {aa.LINUX_TABLE};")
 
     # ========== TEST CASE 1: 100% Availability ==========
 
@@ -406,6 +419,48 @@ class TestAgentAvailability(unittest.TestCase):
 
     # ========== Additional Helper Tests ==========
 
+    def test_duplicate_baseline_rows_rejected(self):
+        """Test that a baseline CSV with a repeated row is rejected."""
+        windows_baseline = Path(self.temp_dir) / "windows_baseline.csv"
+
+        with open(windows_baseline, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(aa.BASELINE_COLUMNS)
+            writer.writerow(["Domain1", "WIN-HOST01"])
+            writer.writerow(["Domain1", "WIN-HOST02"])
+            writer.writerow(["Domain1", "WIN-HOST01"])
+
+        with self.assertRaises(aa.CSVValidationError):
+            aa.load_baseline_windows(windows_baseline)
+
+        self.assertEqual(aa.get_baseline_agents(aa.WINDOWS_TABLE), {})
+
+    def test_database_info_size_grows_after_load(self):
+        """Test that the reported database size reflects a baseline load."""
+        # show_database_info stats the file, so it needs DB_FILE as a Path
+        aa.DB_FILE = self.test_db_path
+
+        def reported_size_kb():
+            output = io.StringIO()
+            with redirect_stdout(output):
+                aa.show_database_info()
+            size_line = next(line for line in output.getvalue().splitlines() if line.startswith("Size:"))
+            return float(size_line.split()[1])
+
+        size_before = reported_size_kb()
+
+        windows_baseline = Path(self.temp_dir) / "windows_baseline.csv"
+        with open(windows_baseline, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(aa.BASELINE_COLUMNS)
+            for i in range(5000):
+                writer.writerow(["Domain1", f"WIN-HOST{i:05d}"])
+
+        with redirect_stdout(io.StringIO()):
+            aa.load_baseline_windows(windows_baseline)
+
+        self.assertGreater(reported_size_kb(), size_before)
+
     def test_date_parsing_valid(self):
         """Test valid date parsing."""
         date_str = "2024-01-15 14:30:00"
@@ -414,11 +469,47 @@ class TestAgentAvailability(unittest.TestCase):
         self.assertEqual(result.month, 1)
         self.assertEqual(result.day, 15)
 
+    def test_date_parsing_abbreviated_month_with_fraction(self):
+        """Test 'Jan 31, 2026 @ 12:38:00.504' keeps the fractional seconds."""
+        result = aa.parse_available_date("Jan 31, 2026 @ 12:38:00.504")
+        self.assertEqual(result, datetime(2026, 1, 31, 12, 38, 0, 504000))
+
+    def test_date_parsing_full_month_without_fraction(self):
+        """Test full month names without fractional seconds."""
+        result = aa.parse_available_date("January 31, 2026 @ 12:38:00")
+        self.assertEqual(result, datetime(2026, 1, 31, 12, 38, 0))
+
+    def test_date_parsing_numeric_layouts(self):
+        """Test the DD-MM-YYYY, MM/DD/YYYY and YYYY/MM/DD layouts."""
+        expected = datetime(2026, 1, 31, 12, 38, 0)
+        self.assertEqual(aa.parse_available_date("31-01-2026 12:38:00"), expected)
+        self.assertEqual(aa.parse_available_date("01/31/2026 12:38:00"), expected)
+        self.assertEqual(aa.parse_available_date("2026/01/31 12:38:00"), expected)
+
+    def test_date_parsing_invalid_calendar_date(self):
+        """Test a well-formed but impossible date raises error."""
+        with self.assertRaises(aa.CSVValidationError):
+            aa.parse_available_date("2026-02-30 00:00:00")
+
     def test_date_parsing_invalid(self):
         """Test invalid date parsing raises error."""
         with self.assertRaises(aa.CSVValidationError):
             aa.parse_available_date("invalid-date")
 
+    def test_invalid_duplicate_date_raises(self):
+        """Test that an invalid date on a duplicate row is still rejected."""
+        windows_avail = Path(self.temp_dir) / "windows_avail.csv"
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        with open(windows_avail, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(aa.AVAILABILITY_COLUMNS)
+            writer.writerow(["D1", "H1", now_str])
+            writer.writerow(["D1", "H1", "2020-99-99 00:00:00"])
+
+        with self.assertRaises(aa.CSVValidationError):
+            aa.get_availability_records(windows_avail)
+
     def test_within_last_24_hours_true(self):
         """Test that recent time is within 24 hours."""
         now = datetime.now()